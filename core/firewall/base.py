@@ -1,11 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+import ipaddress
 import logging
-from dataclasses import dataclass
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern an optional string so equal identifiers share one object"""
+    return sys.intern(value) if value is not None else None
+
+@dataclass(slots=True, frozen=True)
 class IPObject:
     """
     Represents an IP object in a firewall
@@ -15,50 +24,168 @@ class IPObject:
     type: str  # 'host', 'network', 'range', etc.
     uid: Optional[str] = None
     description: Optional[str] = None
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     
     def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+        # Few distinct values, shared across many objects
+        object.__setattr__(self, 'type', sys.intern(self.type))
+        # Identifiers are compared in membership checks; interned strings
+        # usually match by identity before a full comparison
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        object.__setattr__(self, 'uid', _intern(self.uid))
+    
+    @property
+    def networks(self) -> Tuple[Union[ipaddress.IPv4Network, ipaddress.IPv6Network], ...]:
+        """
+        Networks covered by the value, empty if it cannot be parsed
+        
+        The value is parsed on first access rather than at construction, so
+        objects that are only listed or deleted never pay for ipaddress.
+        Parses are memoized by value string, outside the dataclass fields.
+        """
+        return _parse_networks(self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """
     Represents a group of objects in a firewall
     """
     name: str
-    members: List[Union[str, 'Group']]  # List of member UIDs or nested groups
+    members: Set[str] = field(default_factory=set)  # Set of member UIDs, nested groups included
     type: str = "group"
     uid: Optional[str] = None
     description: Optional[str] = None
     
     def __post_init__(self):
-        if self.members is None:
-            self.members = []
+        self.type = sys.intern(self.type)
+        self.name = sys.intern(self.name)
+        self.uid = _intern(self.uid)
+        # Connectors build groups from JSON lists; set methods are relied on
+        if not isinstance(self.members, set):
+            self.members = set(self.members)
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """
     Represents a firewall rule
     """
     name: str
     uid: Optional[str] = None
-    source: List[str] = None  # List of source object UIDs
-    destination: List[str] = None  # List of destination object UIDs
-    service: List[str] = None  # List of service UIDs
+    source: Set[str] = field(default_factory=set)  # Set of source object UIDs
+    destination: Set[str] = field(default_factory=set)  # Set of destination object UIDs
+    service: Set[str] = field(default_factory=set)  # Set of service UIDs
     action: str = "deny"  # Default to deny for safety
     enabled: bool = True
     position: Optional[int] = None
     
     def __post_init__(self):
-        if self.source is None:
-            self.source = []
-        if self.destination is None:
-            self.destination = []
-        if self.service is None:
-            self.service = []
+        self.action = sys.intern(self.action)
+        self.name = sys.intern(self.name)
+        self.uid = _intern(self.uid)
+        # Connectors build rules from JSON lists; set methods are relied on
+        if not isinstance(self.source, set):
+            self.source = set(self.source)
+        if not isinstance(self.destination, set):
+            self.destination = set(self.destination)
+        if not isinstance(self.service, set):
+            self.service = set(self.service)
+
+
+def parse_ip_value(value: str) -> List[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+    """
+    Parse an IPObject value into the networks it covers
+    
+    Args:
+        value: Host address, CIDR network or "first-last" address range
+        
+    Returns:
+        List of networks covering the value, empty if it cannot be parsed
+    """
+    try:
+        if '-' in value:
+            first, last = (ipaddress.ip_address(part.strip()) for part in value.split('-', 1))
+            return list(ipaddress.summarize_address_range(first, last))
+        return [ipaddress.ip_network(value, strict=False)]
+    except (TypeError, ValueError):
+        return []
+
+
+@lru_cache(maxsize=4096)
+def _parse_networks(value: str) -> Tuple[Union[ipaddress.IPv4Network, ipaddress.IPv6Network], ...]:
+    """Memoized, immutable form of parse_ip_value for IPObject.networks"""
+    return tuple(parse_ip_value(value))
+
+
+class IPRangeIndex:
+    """
+    Containment index over IP object values
+    
+    Networks are bucketed by IP version and prefix length and keyed by their
+    integer network address, so finding the objects that contain an address
+    costs one dict lookup per prefix length in use rather than a scan of
+    every object.
+    """
+    
+    def __init__(self):
+        self._buckets: Dict[Tuple[int, int], Dict[int, List[IPObject]]] = {}
+        self._lookup_order: List[Tuple[int, int]] = []
+    
+    def build(self, objects: Iterable[IPObject]) -> 'IPRangeIndex':
+        """
+        Add every object to the index
+        
+        Args:
+            objects: IP objects to index
+            
+        Returns:
+            IPRangeIndex: The index itself, for chaining
+        """
+        for obj in objects:
+            self.add(obj)
+        return self
+    
+    def add(self, obj: IPObject) -> None:
+        """
+        Add a single IP object to the index
+        
+        Values that cannot be parsed as an address, network or range are
+        skipped.
+        
+        Args:
+            obj: IP object to index
+        """
+        for network in obj.networks:
+            key = (network.version, network.prefixlen)
+            if key not in self._buckets:
+                self._buckets[key] = {}
+                self._lookup_order = sorted(self._buckets, key=lambda k: -k[1])
+            self._buckets[key].setdefault(int(network.network_address), []).append(obj)
+    
+    def find_containing(self, ip: str) -> List[IPObject]:
+        """
+        Find the IP objects whose value contains an address
+        
+        Args:
+            ip: IPv4 or IPv6 address
+            
+        Returns:
+            List[IPObject]: Matching objects, most specific prefix first
+            
+        Raises:
+            ValueError: If ip is not a valid IPv4 or IPv6 address
+        """
+        address = ipaddress.ip_address(ip)
+        value = int(address)
+        width = address.max_prefixlen
+        matches = []
+        for version, prefixlen in self._lookup_order:
+            if version != address.version:
+                continue
+            mask = ((1 << prefixlen) - 1) << (width - prefixlen)
+            matches.extend(self._buckets[(version, prefixlen)].get(value & mask, ()))
+        return matches
 
 
 class FirewallError(Exception):
@@ -84,8 +211,38 @@ class DependencyError(FirewallError):
 class FirewallConnector(ABC):
     """
     Abstract connector for firewall management
+    
+    Concrete connectors set backend_name to register themselves with
+    FirewallFactory under that firewall type. Only a class that sets the
+    name itself is registered, so subclassing a backend does not replace it.
     """
     
+    backend_name: ClassVar[Optional[str]] = None
+    _registry: ClassVar[Dict[str, Type['FirewallConnector']]] = {}
+    
+    # Upper bound on concurrent API calls when editing independent containers
+    max_parallel_edits: int = 16
+    # Maximum number of fetched objects kept by the getter cache
+    object_cache_size: int = 1024
+    # Whether a connected instance may be kept and reused by later tasks;
+    # backends whose state lives in the connector itself opt out
+    reuse_connection: bool = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        backend_name = cls.__dict__.get('backend_name')
+        if backend_name:
+            FirewallConnector._registry[backend_name] = cls
+    
+    def __init__(self):
+        # Reverse index of member UID -> referencing groups and rules,
+        # built on demand by refresh_dependency_index()
+        self._dep_index: Optional[Dict[str, Dict[str, List[str]]]] = None
+        # Containment index over IP object values, built by get_ip_range_index()
+        self._ip_range_index: Optional[IPRangeIndex] = None
+        # LRU cache of fetched objects keyed by (kind, identifier)
+        self._object_cache: OrderedDict = OrderedDict()
+    
     @abstractmethod
     def connect(self, **kwargs) -> bool:
         """
@@ -195,6 +352,10 @@ class FirewallConnector(ABC):
         """
         Get all dependencies for an IP object
         
+        Each group or rule ID should be listed at most once, even when the
+        IP object is referenced several times by the same container (for
+        example in both the source and destination of a rule).
+        
         Args:
             ip_object_id: ID of the IP object
             
@@ -222,6 +383,9 @@ class FirewallConnector(ABC):
         """
         Remove an IP object from a rule
         
+        The object is removed from both the source and the destination in a
+        single update of the rule.
+        
         Args:
             rule_id: ID of the rule
             ip_object_id: ID of the IP object
@@ -280,6 +444,326 @@ class FirewallConnector(ABC):
         """
         pass
     
+    def bulk_remove_members(self, edits: Dict[str, List[str]]) -> Dict[str, Union[bool, Exception]]:
+        """
+        Remove members from several groups in one batch
+        
+        The default implementation issues one remove_ip_from_group call per
+        member. Connectors whose API can apply several group edits in a
+        single request should override this. A failed edit must not stop
+        the others, so failures are reported per group instead of raised.
+        
+        Args:
+            edits: Mapping of group ID to the member IDs to remove from it
+            
+        Returns:
+            Dict[str, Union[bool, Exception]]: Mapping of group ID to whether
+            it was modified, or to the exception raised while editing it
+        """
+        def remove_members(group_id: str) -> bool:
+            modified = False
+            for member_id in edits[group_id]:
+                modified = self.remove_ip_from_group(group_id, member_id) or modified
+            return modified
+        
+        return self._run_concurrently(remove_members, edits)
+    
+    def _run_concurrently(self, func: Callable[[str], Any], container_ids: Iterable[str]) -> Dict[str, Any]:
+        """
+        Apply func to each container ID on a thread pool
+        
+        Edits to different containers are independent, so the API calls can
+        overlap instead of paying one round-trip after another.
+        
+        Args:
+            func: Callable taking a container ID
+            container_ids: IDs to process
+            
+        Returns:
+            Dict[str, Any]: Mapping of container ID to the return value of func,
+            or to the exception it raised, in input order
+        """
+        container_ids = list(container_ids)
+        outcomes = {}
+        if len(container_ids) <= 1 or self.max_parallel_edits <= 1:
+            for container_id in container_ids:
+                try:
+                    outcomes[container_id] = func(container_id)
+                except Exception as e:
+                    outcomes[container_id] = e
+            return outcomes
+        
+        workers = min(self.max_parallel_edits, len(container_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {container_id: executor.submit(func, container_id) for container_id in container_ids}
+            for container_id, future in futures.items():
+                error = future.exception()
+                outcomes[container_id] = error if error is not None else future.result()
+        return outcomes
+    
+    def get_groups_by_ids(self, group_ids: List[str]) -> Dict[str, Optional[Group]]:
+        """
+        Get several groups in one pass
+        
+        Connectors whose API can look up many groups in a single request
+        should override this; the default calls get_group per ID.
+        
+        Args:
+            group_ids: IDs of the groups to fetch
+            
+        Returns:
+            Dict[str, Optional[Group]]: Mapping of group ID to group, or None if not found
+        """
+        return {group_id: self._get_cached("group", group_id, self.get_group) for group_id in group_ids}
+    
+    def get_rules_by_ids(self, rule_ids: List[str]) -> Dict[str, Optional[Rule]]:
+        """
+        Get several rules in one pass
+        
+        Connectors whose API can look up many rules in a single request
+        should override this; the default calls get_rule per ID.
+        
+        Args:
+            rule_ids: IDs of the rules to fetch
+            
+        Returns:
+            Dict[str, Optional[Rule]]: Mapping of rule ID to rule, or None if not found
+        """
+        return {rule_id: self._get_cached("rule", rule_id, self.get_rule) for rule_id in rule_ids}
+    
+    def iter_ip_objects(self, filter_params: Optional[Dict] = None) -> Iterator[IPObject]:
+        """
+        Iterate over IP objects from the firewall
+        
+        Lets callers that need only the first match or a count stop early
+        instead of materializing the full list. Connectors that can stream
+        or page their results should override this; the default iterates
+        over get_ip_objects.
+        
+        Args:
+            filter_params: Optional filtering parameters
+            
+        Returns:
+            Iterator[IPObject]: IP objects, one at a time
+        """
+        return iter(self.get_ip_objects(filter_params))
+    
+    def iter_groups(self, filter_params: Optional[Dict] = None) -> Iterator[Group]:
+        """
+        Iterate over groups from the firewall
+        
+        See iter_ip_objects; the default iterates over get_groups.
+        
+        Args:
+            filter_params: Optional filtering parameters
+            
+        Returns:
+            Iterator[Group]: Groups, one at a time
+        """
+        return iter(self.get_groups(filter_params))
+    
+    def iter_rules(self, filter_params: Optional[Dict] = None) -> Iterator[Rule]:
+        """
+        Iterate over rules from the firewall
+        
+        See iter_ip_objects; the default iterates over get_rules.
+        
+        Args:
+            filter_params: Optional filtering parameters
+            
+        Returns:
+            Iterator[Rule]: Rules, one at a time
+        """
+        return iter(self.get_rules(filter_params))
+    
+    def _get_cached(self, kind: str, identifier: str, getter: Callable[[str], Any]) -> Any:
+        """
+        Get an object through the LRU object cache
+        
+        Batch cleanups tend to touch the same groups and rules again and
+        again, so fetched objects are kept and reused until evicted. The
+        cache only lives for one delete_ip_object_with_dependencies or
+        delete_ip_objects_bulk call, which clear it on entry, so emptiness
+        is never decided from copies fetched earlier. Misses are not cached.
+        
+        Args:
+            kind: Object kind ("ip_object", "group" or "rule")
+            identifier: Name or UID passed to getter
+            getter: Connector method used on a cache miss
+            
+        Returns:
+            The cached or freshly fetched object, or None if not found
+        """
+        key = (kind, identifier)
+        if key in self._object_cache:
+            self._object_cache.move_to_end(key)
+            return self._object_cache[key]
+        
+        obj = getter(identifier)
+        if obj is not None:
+            self._object_cache[key] = obj
+            if len(self._object_cache) > self.object_cache_size:
+                self._object_cache.popitem(last=False)
+        return obj
+    
+    def _evict_cached(self, kind: str, *identifiers: str) -> None:
+        """Drop objects from the LRU object cache after they were changed"""
+        for identifier in identifiers:
+            self._object_cache.pop((kind, identifier), None)
+    
+    def clear_object_cache(self) -> None:
+        """Drop every cached object, e.g. after changes made outside this connector"""
+        self._object_cache.clear()
+    
+    def refresh_dependency_index(self) -> None:
+        """
+        Build the reverse dependency index from all groups and rules
+        
+        Walks the policy once so that later lookups through
+        get_indexed_dependencies cost a dict access instead of a scan of
+        every group and rule. Worth it when several IP objects are cleaned
+        up in a row.
+        """
+        index: Dict[str, Dict[str, List[str]]] = {}
+        for group in self.iter_groups():
+            for member_id in group.members:
+                index.setdefault(member_id, {"groups": [], "rules": []})["groups"].append(group.uid)
+        for rule in self.iter_rules():
+            for member_id in rule.source | rule.destination:
+                index.setdefault(member_id, {"groups": [], "rules": []})["rules"].append(rule.uid)
+        self._dep_index = index
+    
+    def invalidate_dependency_index(self) -> None:
+        """Drop the reverse dependency index so it is rebuilt on next use"""
+        self._dep_index = None
+    
+    def get_indexed_dependencies(self, ip_object_uid: str) -> Dict[str, List[Any]]:
+        """
+        Get dependencies for an IP object from the reverse index
+        
+        Args:
+            ip_object_uid: UID of the IP object
+            
+        Returns:
+            Dict[str, List[Any]]: Dictionary with dependencies by type
+        """
+        if self._dep_index is None:
+            self.refresh_dependency_index()
+        entry = self._dep_index.get(ip_object_uid, {})
+        return {
+            "groups": list(entry.get("groups", [])),
+            "rules": list(entry.get("rules", []))
+        }
+    
+    def get_ip_range_index(self) -> IPRangeIndex:
+        """
+        Get the containment index over all IP objects, building it on first use
+        
+        The index is dropped whenever an IP object is deleted through
+        delete_ip_object_with_dependencies.
+        
+        Returns:
+            IPRangeIndex: Index of all IP objects on the firewall
+        """
+        if self._ip_range_index is None:
+            self._ip_range_index = IPRangeIndex().build(self.iter_ip_objects())
+        return self._ip_range_index
+    
+    def _remove_from_containers(
+        self,
+        ip_object_id: str,
+        ip_uid: str,
+        dependencies: Dict[str, List[Any]],
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Remove an IP object from its groups and rules, deleting any left empty
+        
+        Args:
+            ip_object_id: ID the caller used for the IP object
+            ip_uid: UID of the IP object as referenced by its containers
+            dependencies: Dependencies as returned by get_dependencies
+            result: Result dictionary of delete_ip_object_with_dependencies,
+                updated in place
+        """
+        # Collect all edits up front so they can be dispatched as one batch;
+        # keying by container ID also drops any duplicate dependency entries
+        pending_group_edits = {
+            group_id: [ip_uid] for group_id in dependencies.get("groups", [])
+        }
+        pending_rule_edits = {
+            rule_id: [ip_uid] for rule_id in dependencies.get("rules", [])
+        }
+        
+        # Fetch every affected container once, through the object cache, so
+        # emptiness can be decided locally after the edits instead of
+        # re-fetching each one
+        groups_cache = self.get_groups_by_ids(list(pending_group_edits))
+        rules_cache = self.get_rules_by_ids(list(pending_rule_edits))
+        
+        # Process group dependencies; a failed edit only fails its own group
+        group_outcomes = {}
+        if pending_group_edits:
+            logger.debug("Removing IP %s from %d groups", ip_object_id, len(pending_group_edits))
+            try:
+                group_outcomes = self.bulk_remove_members(pending_group_edits)
+            except Exception as e:
+                # The batch itself failed, so no group edit is known to have applied
+                group_outcomes = dict.fromkeys(pending_group_edits, e)
+        
+        for group_id, removed in pending_group_edits.items():
+            try:
+                if isinstance(group_outcomes.get(group_id), Exception):
+                    raise group_outcomes[group_id]
+                result["groups_modified"].append(group_id)
+                
+                # Apply the edit to the cached copy, then delete the group
+                # if it is now empty
+                group = groups_cache.get(group_id)
+                if group:
+                    group.members.difference_update(removed)
+                    if not group.members:
+                        logger.debug("Deleting empty group %s", group_id)
+                        self.delete_empty_group(group_id)
+                        self._evict_cached("group", group_id)
+                        result["groups_deleted"].append(group_id)
+            except Exception as e:
+                self._evict_cached("group", group_id)
+                error_msg = f"Error processing group {group_id}: {str(e)}"
+                logger.error(error_msg)
+                result["errors"].append(error_msg)
+        
+        # Process rule dependencies; the edits are independent so they
+        # run concurrently, while deletions stay sequential
+        def remove_from_rule(rule_id: str) -> None:
+            logger.debug("Removing IP %s from rule %s", ip_object_id, rule_id)
+            for member_id in pending_rule_edits[rule_id]:
+                self.remove_ip_from_rule(rule_id, member_id)
+        
+        rule_outcomes = self._run_concurrently(remove_from_rule, pending_rule_edits)
+        for rule_id, member_ids in pending_rule_edits.items():
+            try:
+                if isinstance(rule_outcomes[rule_id], Exception):
+                    raise rule_outcomes[rule_id]
+                result["rules_modified"].append(rule_id)
+                
+                # Apply the edit to the cached copy, then delete the rule
+                # if it is now empty
+                rule = rules_cache.get(rule_id)
+                if rule:
+                    rule.source.difference_update(member_ids)
+                    rule.destination.difference_update(member_ids)
+                    if not rule.source and not rule.destination:
+                        logger.debug("Deleting empty rule %s", rule_id)
+                        self.delete_empty_rule(rule_id)
+                        self._evict_cached("rule", rule_id)
+                        result["rules_deleted"].append(rule_id)
+            except Exception as e:
+                self._evict_cached("rule", rule_id)
+                error_msg = f"Error processing rule {rule_id}: {str(e)}"
+                logger.error(error_msg)
+                result["errors"].append(error_msg)
+    
     def delete_ip_object_with_dependencies(self, ip_object_id: str, auto_commit: bool = True) -> Dict[str, Any]:
         """
         Delete an IP object and clean up any dependencies
@@ -299,7 +783,19 @@ class FirewallConnector(ABC):
         Returns:
             Dict[str, Any]: Results of the operation
         """
-        logger.info(f"Starting deletion of IP object {ip_object_id} with dependencies")
+        # Cached copies decide which containers get deleted, so none fetched
+        # before this call may be trusted
+        self.clear_object_cache()
+        return self._delete_with_dependencies(ip_object_id, auto_commit)
+    
+    def _delete_with_dependencies(self, ip_object_id: str, auto_commit: bool) -> Dict[str, Any]:
+        """
+        Body of delete_ip_object_with_dependencies, using the object cache as is
+        
+        delete_ip_objects_bulk calls this directly so that objects cached
+        for one deletion are reused by the next within the same batch.
+        """
+        logger.info("Starting deletion of IP object %s with dependencies", ip_object_id)
         result = {
             "success": False,
             "ip_object_deleted": False,
@@ -312,53 +808,37 @@ class FirewallConnector(ABC):
         
         try:
             # Get the object to confirm it exists
-            ip_object = self.get_ip_object(ip_object_id)
+            ip_object = self._get_cached("ip_object", ip_object_id, self.get_ip_object)
             if not ip_object:
                 raise ObjectNotFoundError(f"IP object with ID {ip_object_id} not found")
             
-            # Get all dependencies
-            dependencies = self.get_dependencies(ip_object_id)
+            # Get all dependencies, from the reverse index when one is loaded
+            ip_uid = ip_object.uid or ip_object_id
+            if self._dep_index is not None:
+                dependencies = self.get_indexed_dependencies(ip_uid)
+            else:
+                dependencies = self.get_dependencies(ip_object_id)
             
-            # Process group dependencies
-            for group_id in dependencies.get("groups", []):
-                try:
-                    logger.debug(f"Removing IP {ip_object_id} from group {group_id}")
-                    self.remove_ip_from_group(group_id, ip_object_id)
-                    result["groups_modified"].append(group_id)
-                    
-                    # Check if group is now empty and delete if it is
-                    group = self.get_group(group_id)
-                    if group and not group.members:
-                        logger.debug(f"Deleting empty group {group_id}")
-                        self.delete_empty_group(group_id)
-                        result["groups_deleted"].append(group_id)
-                except Exception as e:
-                    error_msg = f"Error processing group {group_id}: {str(e)}"
-                    logger.error(error_msg)
-                    result["errors"].append(error_msg)
-            
-            # Process rule dependencies
-            for rule_id in dependencies.get("rules", []):
-                try:
-                    logger.debug(f"Removing IP {ip_object_id} from rule {rule_id}")
-                    self.remove_ip_from_rule(rule_id, ip_object_id)
-                    result["rules_modified"].append(rule_id)
-                    
-                    # Check if rule is now empty and delete if it is
-                    rule = self.get_rule(rule_id)
-                    if rule and not rule.source and not rule.destination:
-                        logger.debug(f"Deleting empty rule {rule_id}")
-                        self.delete_empty_rule(rule_id)
-                        result["rules_deleted"].append(rule_id)
-                except Exception as e:
-                    error_msg = f"Error processing rule {rule_id}: {str(e)}"
-                    logger.error(error_msg)
-                    result["errors"].append(error_msg)
+            # Leaf objects are the common case; skip the container cleanup
+            if dependencies.get("groups") or dependencies.get("rules"):
+                self._remove_from_containers(ip_object_id, ip_uid, dependencies, result)
+            else:
+                logger.debug("IP object %s has no dependencies", ip_object_id)
             
             # Delete the IP object itself
-            logger.info(f"Deleting IP object {ip_object_id}")
+            logger.info("Deleting IP object %s", ip_object_id)
             if self.delete_ip_object(ip_object_id):
                 result["ip_object_deleted"] = True
+                self._ip_range_index = None
+                self._evict_cached("ip_object", ip_object_id, ip_uid)
+            
+            # Emptied containers are deleted and hold no other members, so on
+            # a clean run only the deleted object's own entry goes stale
+            if self._dep_index is not None:
+                if result["ip_object_deleted"] and not result["errors"]:
+                    self._dep_index.pop(ip_uid, None)
+                else:
+                    self.invalidate_dependency_index()
             
             # Commit changes if auto_commit is True
             if auto_commit:
@@ -371,5 +851,65 @@ class FirewallConnector(ABC):
             error_msg = f"Error deleting IP object {ip_object_id}: {str(e)}"
             logger.error(error_msg)
             result["errors"].append(error_msg)
+            self.invalidate_dependency_index()
+        
+        return result
+    
+    def delete_ip_objects_bulk(self, ids: List[str], auto_commit: bool = True) -> Dict[str, Any]:
+        """
+        Delete several IP objects with their dependencies and commit once
+        
+        Prefer this over calling delete_ip_object_with_dependencies in a
+        loop: the commit, a publish or policy install on most firewalls, is
+        paid once for the whole batch, and the reverse dependency index is
+        built once and shared by every deletion.
+        
+        Args:
+            ids: IDs of the IP objects to delete
+            auto_commit: Whether to commit once all objects are processed
+            
+        Returns:
+            Dict[str, Any]: Per-object results keyed by ID under "results",
+            all errors under "errors", and overall "success"
+        """
+        logger.info("Starting bulk deletion of %d IP objects", len(ids))
+        # The object cache is shared across the batch but not with earlier calls
+        self.clear_object_cache()
+        result = {
+            "success": False,
+            "results": {},
+            "errors": []
+        }
+        
+        # The index is only trusted for the duration of this call; dropping
+        # it afterwards keeps later single deletions on get_dependencies
+        built_index = len(ids) > 1 and self._dep_index is None
+        if built_index:
+            try:
+                self.refresh_dependency_index()
+            except Exception as e:
+                # Each deletion falls back to get_dependencies
+                logger.warning("Could not build dependency index: %s", e)
+        
+        try:
+            for ip_object_id in ids:
+                item_result = self._delete_with_dependencies(ip_object_id, auto_commit=False)
+                result["results"][ip_object_id] = item_result
+                result["errors"].extend(item_result["errors"])
+        finally:
+            if built_index:
+                self.invalidate_dependency_index()
+        
+        if ids and auto_commit:
+            try:
+                logger.info("Committing changes to firewall")
+                self.commit_changes()
+            except Exception as e:
+                error_msg = f"Error committing changes: {str(e)}"
+                logger.error(error_msg)
+                result["errors"].append(error_msg)
         
+        result["success"] = not result["errors"] and all(
+            item_result["success"] for item_result in result["results"].values()
+        )
         return result
\ No newline at end of file
@@ -1,13 +1,13 @@
 import logging
 from typing import Dict, List, Optional, Any, Union
-import requests
 from requests.exceptions import RequestException
-import json
+import orjson
 
 from .base import (
     FirewallConnector, IPObject, Group, Rule,
     AuthenticationError, ObjectNotFoundError, DependencyError
 )
+from .session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +17,10 @@ class CheckpointFirewall(FirewallConnector):
     Uses the Check Point Management API
     """
     
+    backend_name = "checkpoint"
+    
     def __init__(self):
+        super().__init__()
         self.base_url = None
         self.session = None
         self.sid = None
@@ -46,9 +49,8 @@ class CheckpointFirewall(FirewallConnector):
         self.timeout = kwargs.get('timeout', self.timeout)
         self.api_version = kwargs.get('api_version', self.api_version)
         
-        # Create session with SSL verification settings
-        self.session = requests.Session()
-        self.session.verify = kwargs.get('verify_ssl', False)
+        # Create pooled keep-alive session with SSL verification settings
+        self.session = create_session(kwargs.get('verify_ssl', False))
         
         # Prepare login payload
         payload = {
@@ -77,7 +79,11 @@ class CheckpointFirewall(FirewallConnector):
                 raise AuthenticationError("Login successful but no session ID returned")
             
             self.sid = response_json['sid']
-            logger.info(f"Successfully connected to Check Point Management Server")
+            self.session.headers.update({
+                "Content-Type": "application/json",
+                "X-chkp-sid": self.sid
+            })
+            logger.info("Successfully connected to Check Point Management Server")
             return True
             
         except RequestException as e:
@@ -93,7 +99,6 @@ class CheckpointFirewall(FirewallConnector):
             response = self.session.post(
                 f"{self.base_url}/logout",
                 json={},
-                headers=self._get_headers(),
                 timeout=self.timeout
             )
             
@@ -101,42 +106,36 @@ class CheckpointFirewall(FirewallConnector):
             self.session = None
             
             if response.status_code != 200:
-                logger.warning(f"Logout returned non-200 status: {response.status_code}")
+                logger.warning("Logout returned non-200 status: %s", response.status_code)
                 return False
             
             logger.info("Successfully disconnected from Check Point Management Server")
             return True
             
         except RequestException as e:
-            logger.error(f"Error during logout: {str(e)}")
+            logger.error("Error during logout: %s", e)
             self.sid = None
             self.session = None
             return False
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        return {
-            "Content-Type": "application/json",
-            "X-chkp-sid": self.sid
-        }
-    
     def _api_call(self, endpoint: str, payload: Dict) -> Dict:
         """Make an API call to the Check Point Management API"""
         if not self.session or not self.sid:
             raise ConnectionError("Not connected to Check Point Management Server")
         
         try:
+            # orjson encodes and decodes bytes directly, which matters for
+            # large show-* responses
             response = self.session.post(
                 f"{self.base_url}/{endpoint}",
-                json=payload,
-                headers=self._get_headers(),
+                data=orjson.dumps(payload),
                 timeout=self.timeout
             )
             
             if response.status_code != 200:
                 raise Exception(f"API call failed: {response.text}")
             
-            return response.json()
+            return orjson.loads(response.content)
             
         except RequestException as e:
             raise ConnectionError(f"API call error: {str(e)}")
@@ -180,9 +179,14 @@ class CheckpointFirewall(FirewallConnector):
         raise NotImplementedError("Method not implemented yet")
     
     def remove_ip_from_group(self, group_id: str, ip_object_id: str) -> bool:
-        # Implementation using Check Point API
-        # Example code - would need to be completed
-        raise NotImplementedError("Method not implemented yet")
+        """
+        Remove an IP object from a group
+        
+        Uses the set-group members "remove" operation, so the group never
+        has to be fetched first.
+        """
+        self._api_call("set-group", {"uid": group_id, "members": {"remove": ip_object_id}})
+        return True
     
     def remove_ip_from_rule(self, rule_id: str, ip_object_id: str) -> bool:
         # Implementation using Check Point API
@@ -1,18 +1,50 @@
-from typing import Dict, Optional, Any
+from typing import Dict, Type
+import importlib
 import logging
 
 from .base import FirewallConnector
-from .test_firewall import TestFirewall
-from .checkpoint import CheckpointFirewall
-from .fortinet import FortinetFirewall
 
 logger = logging.getLogger(__name__)
 
+# Modules providing the built-in backends. They are imported on first use,
+# which registers their connector class, so that callers who only need the
+# test firewall never import requests.
+_BACKEND_MODULES: Dict[str, str] = {
+    'checkpoint': '.checkpoint',
+    'fortinet': '.fortinet',
+    'test': '.test_firewall',
+}
+
 class FirewallFactory:
     """
     Factory class for creating firewall instances
     """
     
+    @staticmethod
+    def get_connector_class(firewall_type: str) -> Type[FirewallConnector]:
+        """
+        Get the connector class registered for a firewall type
+        
+        Args:
+            firewall_type: Type of firewall ('checkpoint', 'fortinet', 'test')
+            
+        Returns:
+            Type[FirewallConnector]: Connector class for the firewall type
+            
+        Raises:
+            ValueError: If the firewall type is not supported
+        """
+        firewall_type = firewall_type.lower()
+        
+        connector_class = FirewallConnector._registry.get(firewall_type)
+        if connector_class is None and firewall_type in _BACKEND_MODULES:
+            importlib.import_module(_BACKEND_MODULES[firewall_type], __package__)
+            connector_class = FirewallConnector._registry.get(firewall_type)
+        
+        if connector_class is None:
+            raise ValueError(f"Unsupported firewall type: {firewall_type}")
+        return connector_class
+    
     @staticmethod
     def create(firewall_type: str, **kwargs) -> FirewallConnector:
         """
@@ -28,16 +60,7 @@ class FirewallFactory:
         Raises:
             ValueError: If the firewall type is not supported
         """
-        firewall_type = firewall_type.lower()
-        
-        if firewall_type == 'checkpoint':
-            return CheckpointFirewall()
-        elif firewall_type == 'fortinet':
-            return FortinetFirewall()
-        elif firewall_type == 'test':
-            return TestFirewall()
-        else:
-            raise ValueError(f"Unsupported firewall type: {firewall_type}")
+        return FirewallFactory.get_connector_class(firewall_type)()
     
     @staticmethod
     def connect(firewall_type: str, **kwargs) -> FirewallConnector:
@@ -1,12 +1,13 @@
 import logging
 from typing import Dict, List, Optional, Any
-import requests
 from requests.exceptions import RequestException
+import orjson
 
 from .base import (
     FirewallConnector, IPObject, Group, Rule,
     AuthenticationError, ObjectNotFoundError, DependencyError
 )
+from .session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,10 @@ class FortinetFirewall(FirewallConnector):
     Uses the FortiOS REST API
     """
     
+    backend_name = "fortinet"
+    
     def __init__(self):
+        super().__init__()
         self.base_url = None
         self.session = None
         self.api_key = None
@@ -45,18 +49,19 @@ class FortinetFirewall(FirewallConnector):
         if not self.api_key:
             raise AuthenticationError("API key is required for FortiGate connection")
         
-        # Create session with SSL verification settings
-        self.session = requests.Session()
-        self.session.verify = kwargs.get('verify_ssl', False)
+        # Create pooled keep-alive session with SSL verification settings
+        self.session = create_session(kwargs.get('verify_ssl', False))
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        })
         
         try:
             # Test connection with a simple API call
-            headers = self._get_headers()
             vdom_param = f"?vdom={self.vdom}" if self.vdom else ""
             
             response = self.session.get(
                 f"{self.base_url}/cmdb/system/status{vdom_param}",
-                headers=headers,
                 timeout=self.timeout
             )
             
@@ -80,13 +85,6 @@ class FortinetFirewall(FirewallConnector):
         logger.info("Disconnected from FortiGate firewall")
         return True
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-    
     def _build_url(self, endpoint: str) -> str:
         """Build URL with optional vdom parameter"""
         vdom_param = f"?vdom={self.vdom}" if self.vdom else ""
@@ -98,24 +96,24 @@ class FortinetFirewall(FirewallConnector):
             raise ConnectionError("Not connected to FortiGate firewall")
         
         url = self._build_url(endpoint)
-        headers = self._get_headers()
+        body = orjson.dumps(data) if data is not None else None
         
         try:
             if method.upper() == "GET":
-                response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+                response = self.session.get(url, params=params, timeout=self.timeout)
             elif method.upper() == "POST":
-                response = self.session.post(url, headers=headers, json=data, timeout=self.timeout)
+                response = self.session.post(url, data=body, timeout=self.timeout)
             elif method.upper() == "PUT":
-                response = self.session.put(url, headers=headers, json=data, timeout=self.timeout)
+                response = self.session.put(url, data=body, timeout=self.timeout)
             elif method.upper() == "DELETE":
-                response = self.session.delete(url, headers=headers, timeout=self.timeout)
+                response = self.session.delete(url, timeout=self.timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             if response.status_code not in (200, 201, 202, 204):
                 raise Exception(f"API call failed: {response.text}")
             
-            return response.json() if response.text else {}
+            return orjson.loads(response.content) if response.content else {}
             
         except RequestException as e:
             raise ConnectionError(f"API call error: {str(e)}")
@@ -0,0 +1,33 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Sized to cover FirewallConnector.max_parallel_edits with headroom so that
+# concurrent dependency edits reuse pooled TLS connections
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+
+def create_session(verify_ssl: bool = False) -> requests.Session:
+    """
+    Create a requests session tuned for firewall management APIs
+    
+    Connections are kept alive and pooled, and transient gateway errors are
+    retried with a short backoff. urllib3 only retries POST on connection
+    errors, so non-idempotent API calls are never replayed after a response.
+    
+    Args:
+        verify_ssl: Whether to verify the server certificate
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    session.verify = verify_ssl
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    return session
\ No newline at end of file
@@ -1,7 +1,8 @@
-import uuid
 import time
 import logging
-from typing import Dict, List, Optional, Any
+import operator
+from dataclasses import replace
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Set
 from .base import (
     FirewallConnector, IPObject, Group, Rule,
     ObjectNotFoundError, AuthenticationError
@@ -9,20 +10,54 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+def _latency_setting() -> bool:
+    """Read TEST_FIREWALL_SIMULATE_LATENCY from Django settings, if configured"""
+    try:
+        from django.conf import settings
+    except ImportError:
+        return False
+    if not settings.configured:
+        return False
+    return bool(getattr(settings, 'TEST_FIREWALL_SIMULATE_LATENCY', False))
+
 class TestFirewall(FirewallConnector):
     """
     Test implementation of FirewallConnector for development
     Returns mock data for all operations
     """
     
-    def __init__(self):
+    backend_name = "test"
+    # The mock data lives in the instance, so a reused connector would keep
+    # deletions from earlier tasks; every task gets a fresh dataset instead
+    reuse_connection = False
+    
+    # Mock dataset shared by all instances, built once by _generate_mock_data
+    _MOCK_IPS: ClassVar[Optional[List[IPObject]]] = None
+    _MOCK_GROUPS: ClassVar[Optional[List[Group]]] = None
+    _MOCK_RULES: ClassVar[Optional[List[Rule]]] = None
+    
+    def __init__(self, simulate_latency: Optional[bool] = None):
+        super().__init__()
         self.connected = False
+        # Sleep in connect/disconnect/commit like a real API would; off
+        # unless enabled here or by the TEST_FIREWALL_SIMULATE_LATENCY setting
+        if simulate_latency is None:
+            simulate_latency = _latency_setting()
+        self.simulate_latency = simulate_latency
+        # Objects are stored once by UID; the name indexes map name -> UID
         self.mock_ip_objects = {}
         self.mock_groups = {}
         self.mock_rules = {}
-        self._generate_mock_data()
+        self._ip_name_index = {}
+        self._group_name_index = {}
+        self._rule_name_index = {}
+        # Reverse indexes of member UID -> UIDs of the groups/rules using it
+        self._ip_to_groups: Dict[str, Set[str]] = {}
+        self._ip_to_rules: Dict[str, Set[str]] = {}
+        self._load_mock_data()
     
-    def _generate_mock_data(self):
+    @classmethod
+    def _generate_mock_data(cls):
         """Generate sample data for testing"""
         # Create IP objects
         ips = [
@@ -30,88 +65,109 @@ class TestFirewall(FirewallConnector):
                 name="Server1",
                 value="192.168.1.10",
                 type="host",
-                uid=str(uuid.uuid4()),
+                uid="11111111-1111-1111-1111-000000000001",
                 description="Production web server"
             ),
             IPObject(
                 name="Server2",
                 value="192.168.1.11",
                 type="host",
-                uid=str(uuid.uuid4()),
+                uid="11111111-1111-1111-1111-000000000002",
                 description="Production database server"
             ),
             IPObject(
                 name="DevNetwork",
                 value="10.0.1.0/24",
                 type="network",
-                uid=str(uuid.uuid4()),
+                uid="11111111-1111-1111-1111-000000000003",
                 description="Development network"
             ),
             IPObject(
                 name="TestServer",
                 value="192.168.2.50",
                 type="host",
-                uid=str(uuid.uuid4()),
+                uid="11111111-1111-1111-1111-000000000004",
                 description="Test server - Safe to delete"
             )
         ]
         
-        for ip in ips:
-            self.mock_ip_objects[ip.uid] = ip
-            # Also add by name for convenience
-            self.mock_ip_objects[ip.name] = ip
-        
         # Create groups
-        web_servers_id = str(uuid.uuid4())
-        all_servers_id = str(uuid.uuid4())
+        web_servers_id = "22222222-2222-2222-2222-000000000001"
+        all_servers_id = "22222222-2222-2222-2222-000000000002"
         
         web_servers = Group(
             name="WebServers",
             uid=web_servers_id,
-            members=[ips[0].uid],  # Server1
+            members={ips[0].uid},  # Server1
             description="Web servers group"
         )
         
         all_servers = Group(
             name="AllServers",
             uid=all_servers_id,
-            members=[ips[0].uid, ips[1].uid, ips[3].uid, web_servers_id],  # All servers and WebServers group
+            members={ips[0].uid, ips[1].uid, ips[3].uid, web_servers_id},  # All servers and WebServers group
             description="All servers group"
         )
         
-        self.mock_groups[web_servers.uid] = web_servers
-        self.mock_groups[all_servers.uid] = all_servers
-        self.mock_groups[web_servers.name] = web_servers
-        self.mock_groups[all_servers.name] = all_servers
-        
         # Create rules
         allow_web = Rule(
             name="AllowWebAccess",
-            uid=str(uuid.uuid4()),
-            source=[ips[2].uid],  # DevNetwork
-            destination=[web_servers.uid],  # WebServers group
+            uid="33333333-3333-3333-3333-000000000001",
+            source={ips[2].uid},  # DevNetwork
+            destination={web_servers.uid},  # WebServers group
             action="allow",
             position=1
         )
         
         allow_test = Rule(
             name="AllowTestAccess",
-            uid=str(uuid.uuid4()),
-            source=["any"],
-            destination=[ips[3].uid],  # TestServer
+            uid="33333333-3333-3333-3333-000000000002",
+            source={"any"},
+            destination={ips[3].uid},  # TestServer
             action="allow",
             position=2
         )
         
-        self.mock_rules[allow_web.uid] = allow_web
-        self.mock_rules[allow_test.uid] = allow_test
-        self.mock_rules[allow_web.name] = allow_web
-        self.mock_rules[allow_test.name] = allow_test
+        cls._MOCK_IPS = ips
+        cls._MOCK_GROUPS = [web_servers, all_servers]
+        cls._MOCK_RULES = [allow_web, allow_test]
+    
+    def _load_mock_data(self):
+        """Give this instance its own copy of the shared mock dataset"""
+        if self._MOCK_IPS is None:
+            self._generate_mock_data()
+        
+        # IP objects are immutable and can be shared
+        for ip in self._MOCK_IPS:
+            self.mock_ip_objects[ip.uid] = ip
+            # Also index by name for convenience
+            self._ip_name_index[ip.name] = ip.uid
+        
+        # Groups and rules are edited in place, so copy them and their sets
+        for group in self._MOCK_GROUPS:
+            group = replace(group, members=set(group.members))
+            self.mock_groups[group.uid] = group
+            self._group_name_index[group.name] = group.uid
+            for member in group.members:
+                self._ip_to_groups.setdefault(member, set()).add(group.uid)
+        
+        for rule in self._MOCK_RULES:
+            rule = replace(
+                rule,
+                source=set(rule.source),
+                destination=set(rule.destination),
+                service=set(rule.service)
+            )
+            self.mock_rules[rule.uid] = rule
+            self._rule_name_index[rule.name] = rule.uid
+            for member in rule.source | rule.destination:
+                self._ip_to_rules.setdefault(member, set()).add(rule.uid)
     
     def connect(self, **kwargs) -> bool:
-        logger.info(f"Connecting to test firewall with parameters: {kwargs}")
+        logger.info("Connecting to test firewall with parameters: %s", kwargs)
         # Simulate connection delay
-        time.sleep(0.5)
+        if self.simulate_latency:
+            time.sleep(0.5)
         
         # Check for credential failure
         if kwargs.get('username') == 'fail':
@@ -123,7 +179,8 @@ class TestFirewall(FirewallConnector):
     
     def disconnect(self) -> bool:
         logger.info("Disconnecting from test firewall")
-        time.sleep(0.2)  # Simulate delay
+        if self.simulate_latency:
+            time.sleep(0.2)  # Simulate delay
         self.connected = False
         return True
     
@@ -131,136 +188,82 @@ class TestFirewall(FirewallConnector):
         if not self.connected:
             raise ConnectionError("Not connected to firewall")
     
-    def get_ip_objects(self, filter_params: Optional[Dict] = None) -> List[IPObject]:
+    @staticmethod
+    def _lookup(objects: Dict[str, Any], name_index: Dict[str, str], identifier: str) -> Optional[Any]:
+        """Find an object by UID, falling back to its name"""
+        obj = objects.get(identifier)
+        if obj is None and identifier in name_index:
+            obj = objects.get(name_index[identifier])
+        return obj
+    
+    @staticmethod
+    def _filter(objects: Iterable[Any], filter_params: Optional[Dict], object_type: type) -> Iterator[Any]:
+        """Lazily apply filter_params to objects; unknown attributes are ignored"""
+        # Compile the filter once: drop keys that are not fields and compare
+        # all remaining attributes in a single attrgetter call per object
+        fields = object_type.__dataclass_fields__
+        keys = [key for key in filter_params or () if key in fields]
+        if not keys:
+            return iter(objects)
+        getter = operator.attrgetter(*keys)
+        expected = tuple(filter_params[key] for key in keys) if len(keys) > 1 else filter_params[keys[0]]
+        return (obj for obj in objects if getter(obj) == expected)
+    
+    def iter_ip_objects(self, filter_params: Optional[Dict] = None) -> Iterator[IPObject]:
         self._check_connection()
-        logger.info(f"Getting IP objects with filter: {filter_params}")
-        
-        # Use a set to avoid duplicates (since we store objects by both UID and name)
-        unique_ids = set()
-        filtered_objects = []
-        
-        for obj_id, obj in self.mock_ip_objects.items():
-            # Skip name duplicates
-            if obj.uid in unique_ids:
-                continue
-            
-            # Apply filters if provided
-            if filter_params:
-                match = True
-                for key, value in filter_params.items():
-                    if hasattr(obj, key) and getattr(obj, key) != value:
-                        match = False
-                        break
-                if not match:
-                    continue
-            
-            filtered_objects.append(obj)
-            unique_ids.add(obj.uid)
-        
-        return filtered_objects
+        logger.info("Iterating IP objects with filter: %s", filter_params)
+        return self._filter(self.mock_ip_objects.values(), filter_params, IPObject)
+    
+    def get_ip_objects(self, filter_params: Optional[Dict] = None) -> List[IPObject]:
+        return list(self.iter_ip_objects(filter_params))
     
     def get_ip_object(self, identifier: str) -> Optional[IPObject]:
         self._check_connection()
-        logger.info(f"Getting IP object: {identifier}")
-        return self.mock_ip_objects.get(identifier)
+        logger.debug("Getting IP object: %s", identifier)
+        return self._lookup(self.mock_ip_objects, self._ip_name_index, identifier)
     
-    def get_groups(self, filter_params: Optional[Dict] = None) -> List[Group]:
+    def iter_groups(self, filter_params: Optional[Dict] = None) -> Iterator[Group]:
         self._check_connection()
-        logger.info(f"Getting groups with filter: {filter_params}")
-        
-        # Use a set to avoid duplicates
-        unique_ids = set()
-        filtered_groups = []
-        
-        for group_id, group in self.mock_groups.items():
-            # Skip name duplicates
-            if group.uid in unique_ids:
-                continue
-            
-            # Apply filters if provided
-            if filter_params:
-                match = True
-                for key, value in filter_params.items():
-                    if hasattr(group, key) and getattr(group, key) != value:
-                        match = False
-                        break
-                if not match:
-                    continue
-            
-            filtered_groups.append(group)
-            unique_ids.add(group.uid)
-        
-        return filtered_groups
+        logger.info("Iterating groups with filter: %s", filter_params)
+        return self._filter(self.mock_groups.values(), filter_params, Group)
+    
+    def get_groups(self, filter_params: Optional[Dict] = None) -> List[Group]:
+        return list(self.iter_groups(filter_params))
     
     def get_group(self, identifier: str) -> Optional[Group]:
         self._check_connection()
-        logger.info(f"Getting group: {identifier}")
-        return self.mock_groups.get(identifier)
+        logger.debug("Getting group: %s", identifier)
+        return self._lookup(self.mock_groups, self._group_name_index, identifier)
     
-    def get_rules(self, filter_params: Optional[Dict] = None) -> List[Rule]:
+    def iter_rules(self, filter_params: Optional[Dict] = None) -> Iterator[Rule]:
         self._check_connection()
-        logger.info(f"Getting rules with filter: {filter_params}")
-        
-        # Use a set to avoid duplicates
-        unique_ids = set()
-        filtered_rules = []
-        
-        for rule_id, rule in self.mock_rules.items():
-            # Skip name duplicates
-            if rule.uid in unique_ids:
-                continue
-            
-            # Apply filters if provided
-            if filter_params:
-                match = True
-                for key, value in filter_params.items():
-                    if hasattr(rule, key) and getattr(rule, key) != value:
-                        match = False
-                        break
-                if not match:
-                    continue
-            
-            filtered_rules.append(rule)
-            unique_ids.add(rule.uid)
-        
-        return filtered_rules
+        logger.info("Iterating rules with filter: %s", filter_params)
+        return self._filter(self.mock_rules.values(), filter_params, Rule)
+    
+    def get_rules(self, filter_params: Optional[Dict] = None) -> List[Rule]:
+        return list(self.iter_rules(filter_params))
     
     def get_rule(self, identifier: str) -> Optional[Rule]:
         self._check_connection()
-        logger.info(f"Getting rule: {identifier}")
-        return self.mock_rules.get(identifier)
+        logger.debug("Getting rule: %s", identifier)
+        return self._lookup(self.mock_rules, self._rule_name_index, identifier)
     
     def get_dependencies(self, ip_object_id: str) -> Dict[str, List[Any]]:
         self._check_connection()
-        logger.info(f"Getting dependencies for IP object: {ip_object_id}")
+        logger.info("Getting dependencies for IP object: %s", ip_object_id)
         
         ip_object = self.get_ip_object(ip_object_id)
         if not ip_object:
             raise ObjectNotFoundError(f"IP object with ID {ip_object_id} not found")
         
-        dependencies = {
-            "groups": [],
-            "rules": []
+        return {
+            "groups": list(self._ip_to_groups.get(ip_object.uid, ())),
+            "rules": list(self._ip_to_rules.get(ip_object.uid, ()))
         }
-        
-        # Check group dependencies
-        for group_id, group in self.mock_groups.items():
-            if group.uid not in dependencies["groups"] and ip_object.uid in group.members:
-                dependencies["groups"].append(group.uid)
-        
-        # Check rule dependencies
-        for rule_id, rule in self.mock_rules.items():
-            if rule.uid not in dependencies["rules"] and (
-                ip_object.uid in rule.source or 
-                ip_object.uid in rule.destination
-            ):
-                dependencies["rules"].append(rule.uid)
-        
-        return dependencies
     
     def remove_ip_from_group(self, group_id: str, ip_object_id: str) -> bool:
         self._check_connection()
-        logger.info(f"Removing IP {ip_object_id} from group {group_id}")
+        logger.info("Removing IP %s from group %s", ip_object_id, group_id)
         
         group = self.get_group(group_id)
         if not group:
@@ -270,15 +273,15 @@ class TestFirewall(FirewallConnector):
         if not ip_object:
             raise ObjectNotFoundError(f"IP object with ID {ip_object_id} not found")
         
-        if ip_object.uid in group.members:
-            group.members.remove(ip_object.uid)
-            return True
+        modified = ip_object.uid in group.members
+        group.members.discard(ip_object.uid)
+        self._ip_to_groups.get(ip_object.uid, set()).discard(group.uid)
         
-        return False
+        return modified
     
     def remove_ip_from_rule(self, rule_id: str, ip_object_id: str) -> bool:
         self._check_connection()
-        logger.info(f"Removing IP {ip_object_id} from rule {rule_id}")
+        logger.info("Removing IP %s from rule %s", ip_object_id, rule_id)
         
         rule = self.get_rule(rule_id)
         if not rule:
@@ -288,44 +291,33 @@ class TestFirewall(FirewallConnector):
         if not ip_object:
             raise ObjectNotFoundError(f"IP object with ID {ip_object_id} not found")
         
-        modified = False
-        
-        if ip_object.uid in rule.source:
-            rule.source.remove(ip_object.uid)
-            modified = True
-        
-        if ip_object.uid in rule.destination:
-            rule.destination.remove(ip_object.uid)
-            modified = True
+        modified = ip_object.uid in rule.source or ip_object.uid in rule.destination
+        rule.source.discard(ip_object.uid)
+        rule.destination.discard(ip_object.uid)
+        self._ip_to_rules.get(ip_object.uid, set()).discard(rule.uid)
         
         return modified
     
     def delete_empty_group(self, group_id: str) -> bool:
         self._check_connection()
-        logger.info(f"Deleting empty group: {group_id}")
+        logger.info("Deleting empty group: %s", group_id)
         
         group = self.get_group(group_id)
         if not group:
             raise ObjectNotFoundError(f"Group with ID {group_id} not found")
         
         if group.members:
-            logger.warning(f"Group {group_id} is not empty, skipping deletion")
+            logger.warning("Group %s is not empty, skipping deletion", group_id)
             return False
         
-        # Find both name and UID entries and remove them
-        keys_to_remove = []
-        for key, value in self.mock_groups.items():
-            if value.uid == group.uid:
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            del self.mock_groups[key]
+        del self.mock_groups[group.uid]
+        self._group_name_index.pop(group.name, None)
         
         return True
     
     def delete_empty_rule(self, rule_id: str) -> bool:
         self._check_connection()
-        logger.info(f"Deleting empty rule: {rule_id}")
+        logger.info("Deleting empty rule: %s", rule_id)
         
         rule = self.get_rule(rule_id)
         if not rule:
@@ -333,23 +325,19 @@ class TestFirewall(FirewallConnector):
         
         # Consider a rule empty if it has no source or no destination
         if rule.source and rule.destination:
-            logger.warning(f"Rule {rule_id} is not empty, skipping deletion")
+            logger.warning("Rule %s is not empty, skipping deletion", rule_id)
             return False
         
-        # Find both name and UID entries and remove them
-        keys_to_remove = []
-        for key, value in self.mock_rules.items():
-            if value.uid == rule.uid:
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            del self.mock_rules[key]
+        for member in rule.source | rule.destination:
+            self._ip_to_rules.get(member, set()).discard(rule.uid)
+        del self.mock_rules[rule.uid]
+        self._rule_name_index.pop(rule.name, None)
         
         return True
     
     def delete_ip_object(self, ip_object_id: str) -> bool:
         self._check_connection()
-        logger.info(f"Deleting IP object: {ip_object_id}")
+        logger.info("Deleting IP object: %s", ip_object_id)
         
         ip_object = self.get_ip_object(ip_object_id)
         if not ip_object:
@@ -359,22 +347,19 @@ class TestFirewall(FirewallConnector):
         dependencies = self.get_dependencies(ip_object_id)
         if dependencies["groups"] or dependencies["rules"]:
             dep_list = ", ".join(dependencies["groups"] + dependencies["rules"])
-            logger.warning(f"IP object {ip_object_id} still has dependencies: {dep_list}")
+            logger.warning("IP object %s still has dependencies: %s", ip_object_id, dep_list)
             return False
         
-        # Find both name and UID entries and remove them
-        keys_to_remove = []
-        for key, value in self.mock_ip_objects.items():
-            if value.uid == ip_object.uid:
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            del self.mock_ip_objects[key]
+        del self.mock_ip_objects[ip_object.uid]
+        self._ip_name_index.pop(ip_object.name, None)
+        self._ip_to_groups.pop(ip_object.uid, None)
+        self._ip_to_rules.pop(ip_object.uid, None)
         
         return True
     
     def commit_changes(self) -> bool:
         self._check_connection()
         logger.info("Committing changes to test firewall")
-        time.sleep(1)  # Simulate commit delay
+        if self.simulate_latency:
+            time.sleep(1)  # Simulate commit delay
         return True
\ No newline at end of file
@@ -52,6 +52,16 @@ class DeleteIPObjectForm(forms.Form):
         ('fortinet', 'Fortinet FortiGate Firewall'),
     ]
     
+    # Connection fields that must be filled in for each firewall type
+    REQUIRED_BY_TYPE = {
+        'test': (),
+        'checkpoint': ('host', 'username', 'password'),
+        'fortinet': ('host',),
+    }
+    
+    # Fields passed on to the connector's connect()
+    CONNECTION_FIELDS = ('host', 'username', 'password', 'port', 'domain', 'vdom')
+    
     firewall_type = forms.ChoiceField(
         choices=FIREWALL_CHOICES,
         widget=forms.Select(attrs={'class': 'form-select'}),
@@ -120,19 +130,10 @@ class DeleteIPObjectForm(forms.Form):
         cleaned_data = super().clean()
         firewall_type = cleaned_data.get('firewall_type')
         
-        # Skip validation for test firewall
-        if firewall_type == 'test':
-            return cleaned_data
-            
-        # Validate required fields for different firewall types
-        if firewall_type in ['checkpoint', 'fortinet']:
-            required_fields = ['host']
-            if firewall_type == 'checkpoint':
-                required_fields.extend(['username', 'password'])
-            
-            for field in required_fields:
-                if not cleaned_data.get(field):
-                    self.add_error(field, f"This field is required for {firewall_type} firewalls")
+        # Validate required fields for the selected firewall type
+        for field in self.REQUIRED_BY_TYPE.get(firewall_type, ()):
+            if not cleaned_data.get(field):
+                self.add_error(field, f"This field is required for {firewall_type} firewalls")
         
         return cleaned_data
     
@@ -140,10 +141,31 @@ class DeleteIPObjectForm(forms.Form):
         """
         Get connection parameters as a dictionary
         """
-        params = {}
-        for field in ['host', 'username', 'password', 'port', 'domain', 'vdom']:
-            value = self.cleaned_data.get(field)
-            if value:
-                params[field] = value
-                
-        return params
\ No newline at end of file
+        return {
+            field: value
+            for field in self.CONNECTION_FIELDS
+            if (value := self.cleaned_data.get(field))
+        }
+
+class DeleteIPObjectBatchForm(DeleteIPObjectForm):
+    """
+    Form for deleting several IP objects from a firewall in one task
+    """
+    ip_object_id = None
+    
+    ip_object_ids = forms.CharField(
+        widget=forms.Textarea(attrs={'class': 'form-control', 'rows': 5}),
+        help_text="Names or IDs of the IP objects to delete, one per line"
+    )
+    
+    field_order = ['firewall_type', 'ip_object_ids']
+    
+    def clean_ip_object_ids(self):
+        """
+        Split the IDs into a list, dropping blank lines and duplicates
+        """
+        ids = [line.strip() for line in self.cleaned_data['ip_object_ids'].splitlines()]
+        ids = list(dict.fromkeys(ip_object_id for ip_object_id in ids if ip_object_id))
+        if not ids:
+            raise forms.ValidationError("Enter at least one IP object ID")
+        return ids
\ No newline at end of file
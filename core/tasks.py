@@ -1,16 +1,99 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 from celery import shared_task
+from celery.signals import worker_process_shutdown, worker_shutdown
+from .firewall.base import FirewallConnector
 from .firewall.factory import FirewallFactory
 
 logger = logging.getLogger(__name__)
 
+# Connected firewalls kept between tasks in each worker process, keyed by
+# firewall type and connection parameters, least recently used first. Each
+# entry holds the connector and the monotonic time it was released.
+MAX_POOLED_CONNECTORS = 8
+# Seconds a pooled connector may sit idle before it is reconnected; well
+# below the usual management API session timeouts
+POOLED_CONNECTOR_MAX_IDLE = 300
+_CONNECTOR_POOL: "OrderedDict[tuple, tuple]" = OrderedDict()
+_CONNECTOR_POOL_LOCK = threading.Lock()
+
+def _connector_key(firewall_type: str, connection_params: dict) -> tuple:
+    """Build the pool key; values are repr'd since some may be unhashable"""
+    return (firewall_type.lower(), tuple(sorted((k, repr(v)) for k, v in connection_params.items())))
+
+def _disconnect(firewall: FirewallConnector):
+    """Disconnect a firewall, logging rather than raising on failure"""
+    try:
+        firewall.disconnect()
+    except Exception as e:
+        logger.error("Error disconnecting from firewall: %s", e)
+
+def _acquire_connector(firewall_type: str, connection_params: dict) -> FirewallConnector:
+    """
+    Take a connected firewall out of the pool, or create and connect one
+    
+    A pooled connector is removed while in use, so concurrent tasks never
+    share one. Connectors idle for longer than POOLED_CONNECTOR_MAX_IDLE are
+    disconnected instead of reused, since their session may have expired.
+    """
+    with _CONNECTOR_POOL_LOCK:
+        entry = _CONNECTOR_POOL.pop(_connector_key(firewall_type, connection_params), None)
+    
+    if entry is not None:
+        firewall, released_at = entry
+        if time.monotonic() - released_at <= POOLED_CONNECTOR_MAX_IDLE:
+            # The firewall may have been changed by others since the last task
+            firewall.clear_object_cache()
+            firewall.invalidate_dependency_index()
+            return firewall
+        _disconnect(firewall)
+    
+    firewall = FirewallFactory.create(firewall_type)
+    firewall.connect(**connection_params)
+    return firewall
+
+def _release_connector(firewall_type: str, connection_params: dict, firewall: FirewallConnector, reusable: bool = True):
+    """
+    Return a connector to the pool, disconnecting any it displaces
+    
+    A connector that is not reusable, for example after a failed run or one
+    that left changes uncommitted, is disconnected instead so the next task
+    starts from a fresh session. So is any connector whose backend opts out
+    of reuse.
+    """
+    if not reusable or not firewall.reuse_connection:
+        _disconnect(firewall)
+        return
+    
+    with _CONNECTOR_POOL_LOCK:
+        key = _connector_key(firewall_type, connection_params)
+        stale = [_CONNECTOR_POOL.pop(key, None)]
+        _CONNECTOR_POOL[key] = (firewall, time.monotonic())
+        if len(_CONNECTOR_POOL) > MAX_POOLED_CONNECTORS:
+            stale.append(_CONNECTOR_POOL.popitem(last=False)[1])
+    for entry in stale:
+        if entry is not None:
+            _disconnect(entry[0])
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def close_connector_pool(**kwargs):
+    """Disconnect all pooled firewalls when the worker (process) exits"""
+    with _CONNECTOR_POOL_LOCK:
+        entries = list(_CONNECTOR_POOL.values())
+        _CONNECTOR_POOL.clear()
+    for firewall, _ in entries:
+        _disconnect(firewall)
+
 @shared_task
 def sample_task(name="sample_task"):
     """
     A sample task that logs a message.
     This is just a demo task - replace with your actual tasks.
     """
-    logger.info(f"Task {name} executed successfully")
+    logger.info("Task %s executed successfully", name)
     return True
 
 @shared_task
@@ -36,7 +119,7 @@ def delete_ip_object(firewall_type: str, ip_object_id: str, connection_params: d
     Returns:
         dict: Results of the operation
     """
-    logger.info(f"Starting deletion task for IP object {ip_object_id} on {firewall_type} firewall")
+    logger.info("Starting deletion task for IP object %s on %s firewall", ip_object_id, firewall_type)
     result = {
         "success": False,
         "message": "",
@@ -44,10 +127,10 @@ def delete_ip_object(firewall_type: str, ip_object_id: str, connection_params: d
     }
     
     firewall = None
+    reusable = False
     try:
-        # Create and connect to the firewall
-        firewall = FirewallFactory.create(firewall_type)
-        firewall.connect(**connection_params)
+        # Reuse a pooled connection to the firewall, or connect a new one
+        firewall = _acquire_connector(firewall_type, connection_params)
         
         # Delete the IP object with dependencies
         deletion_result = firewall.delete_ip_object_with_dependencies(ip_object_id, auto_commit)
@@ -55,6 +138,10 @@ def delete_ip_object(firewall_type: str, ip_object_id: str, connection_params: d
         result["success"] = deletion_result["success"]
         result["details"] = deletion_result
         
+        # Errors may come from a broken session, and uncommitted changes
+        # must not be published by the next task, so only pool clean runs
+        reusable = deletion_result["success"] and auto_commit
+        
         if result["success"]:
             result["message"] = f"Successfully deleted IP object {ip_object_id} and its dependencies"
         else:
@@ -62,16 +149,71 @@ def delete_ip_object(firewall_type: str, ip_object_id: str, connection_params: d
             result["message"] = f"Failed to delete IP object: {'; '.join(errors)}"
             
     except Exception as e:
-        logger.exception(f"Error in delete_ip_object task: {str(e)}")
+        logger.exception("Error in delete_ip_object task: %s", e)
+        result["success"] = False
+        result["message"] = f"Error: {str(e)}"
+        
+    finally:
+        # Pool the connection for the next task, or disconnect it
+        if firewall:
+            _release_connector(firewall_type, connection_params, firewall, reusable)
+    
+    return result
+
+@shared_task
+def delete_ip_object_batch(firewall_type: str, ip_object_ids: list, connection_params: dict, auto_commit: bool = True):
+    """
+    Delete several IP objects from a firewall and clean up dependencies
+    
+    Connects once and commits once for the whole batch, instead of once per
+    object as separate delete_ip_object tasks would.
+    
+    Args:
+        firewall_type: Type of firewall ('checkpoint', 'fortinet', 'test')
+        ip_object_ids: IDs of the IP objects to delete
+        connection_params: Connection parameters for the firewall
+        auto_commit: Whether to commit changes once all objects are processed
+        
+    Returns:
+        dict: Results of the operation, with per-object details
+    """
+    logger.info("Starting batch deletion task for %d IP objects on %s firewall", len(ip_object_ids), firewall_type)
+    result = {
+        "success": False,
+        "message": "",
+        "details": {}
+    }
+    
+    firewall = None
+    reusable = False
+    try:
+        # Reuse a pooled connection to the firewall, or connect a new one
+        firewall = _acquire_connector(firewall_type, connection_params)
+        
+        # Delete all IP objects, committing once at the end
+        deletion_result = firewall.delete_ip_objects_bulk(ip_object_ids, auto_commit)
+        
+        result["success"] = deletion_result["success"]
+        result["details"] = deletion_result
+        
+        # Errors may come from a broken session, and uncommitted changes
+        # must not be published by the next task, so only pool clean runs
+        reusable = deletion_result["success"] and auto_commit
+        
+        if result["success"]:
+            result["message"] = f"Successfully deleted {len(ip_object_ids)} IP objects and their dependencies"
+        else:
+            errors = deletion_result.get("errors", [])
+            result["message"] = f"Failed to delete some IP objects: {'; '.join(errors)}"
+            
+    except Exception as e:
+        logger.exception("Error in delete_ip_object_batch task: %s", e)
         result["success"] = False
         result["message"] = f"Error: {str(e)}"
         
     finally:
-        # Always disconnect from the firewall
+        # Pool the connection for the next task, or disconnect it
         if firewall:
-            try:
-                firewall.disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting from firewall: {str(e)}")
+            _release_connector(firewall_type, connection_params, firewall, reusable)
     
     return result
\ No newline at end of file
@@ -0,0 +1,423 @@
+from dataclasses import asdict, fields, replace
+from unittest import mock
+
+import orjson
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, SimpleTestCase
+
+from . import tasks, views
+from .firewall.base import Group, IPObject, IPRangeIndex, Rule, parse_ip_value
+from .firewall.factory import FirewallFactory
+from .firewall.test_firewall import TestFirewall
+
+
+class PooledTestFirewall(TestFirewall):
+    """
+    Test firewall that opts back in to connection reuse
+    """
+    
+    reuse_connection = True
+    
+    def disconnect(self) -> bool:
+        self.disconnected = True
+        return super().disconnect()
+
+
+class ConnectorPoolTests(SimpleTestCase):
+    """
+    Tests for the per-worker connector pool in core.tasks
+    """
+    
+    params = {'host': 'fw1', 'username': 'admin'}
+    
+    def setUp(self):
+        tasks._CONNECTOR_POOL.clear()
+        patcher = mock.patch.object(tasks.FirewallFactory, 'create', side_effect=lambda firewall_type: PooledTestFirewall())
+        self.create = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(tasks._CONNECTOR_POOL.clear)
+    
+    def test_acquire_connects_new_connector(self):
+        firewall = tasks._acquire_connector('test', self.params)
+        
+        self.assertTrue(firewall.connected)
+        self.create.assert_called_once_with('test')
+    
+    def test_released_connector_is_reused(self):
+        firewall = tasks._acquire_connector('test', self.params)
+        firewall.get_indexed_dependencies('unknown')
+        tasks._release_connector('test', self.params, firewall)
+        
+        reused = tasks._acquire_connector('test', self.params)
+        
+        self.assertIs(reused, firewall)
+        self.assertIsNone(reused._dep_index)
+        self.assertEqual(self.create.call_count, 1)
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 0)
+    
+    def test_other_parameters_get_another_connector(self):
+        firewall = tasks._acquire_connector('test', self.params)
+        tasks._release_connector('test', self.params, firewall)
+        
+        other = tasks._acquire_connector('test', {**self.params, 'host': 'fw2'})
+        
+        self.assertIsNot(other, firewall)
+    
+    def test_release_not_reusable_disconnects(self):
+        firewall = tasks._acquire_connector('test', self.params)
+        tasks._release_connector('test', self.params, firewall, reusable=False)
+        
+        self.assertTrue(firewall.disconnected)
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 0)
+    
+    def test_backend_opting_out_is_not_pooled(self):
+        firewall = TestFirewall()
+        firewall.connect()
+        tasks._release_connector('test', self.params, firewall)
+        
+        self.assertFalse(firewall.connected)
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 0)
+    
+    def test_idle_connector_is_replaced(self):
+        firewall = tasks._acquire_connector('test', self.params)
+        tasks._release_connector('test', self.params, firewall)
+        
+        with mock.patch.object(tasks, 'POOLED_CONNECTOR_MAX_IDLE', -1):
+            fresh = tasks._acquire_connector('test', self.params)
+        
+        self.assertIsNot(fresh, firewall)
+        self.assertTrue(firewall.disconnected)
+    
+    def test_least_recently_used_connector_is_evicted(self):
+        first = tasks._acquire_connector('test', self.params)
+        second_params = {**self.params, 'host': 'fw2'}
+        second = tasks._acquire_connector('test', second_params)
+        
+        with mock.patch.object(tasks, 'MAX_POOLED_CONNECTORS', 1):
+            tasks._release_connector('test', self.params, first)
+            tasks._release_connector('test', second_params, second)
+        
+        self.assertTrue(first.disconnected)
+        self.assertFalse(getattr(second, 'disconnected', False))
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 1)
+    
+    def test_close_connector_pool_disconnects_all(self):
+        firewall = tasks._acquire_connector('test', self.params)
+        tasks._release_connector('test', self.params, firewall)
+        
+        tasks.close_connector_pool()
+        
+        self.assertTrue(firewall.disconnected)
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 0)
+    
+    def test_failed_deletion_is_not_pooled(self):
+        result = tasks.delete_ip_object('test', 'NoSuchObject', self.params)
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 0)
+    
+    def test_uncommitted_deletion_is_not_pooled(self):
+        result = tasks.delete_ip_object('test', 'TestServer', self.params, auto_commit=False)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 0)
+    
+    def test_successful_deletion_is_pooled(self):
+        result = tasks.delete_ip_object('test', 'TestServer', self.params)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(len(tasks._CONNECTOR_POOL), 1)
+
+
+class ConnectorRegistryTests(SimpleTestCase):
+    """
+    Tests for backend registration through FirewallConnector subclasses
+    """
+    
+    def test_subclass_does_not_replace_registered_backend(self):
+        self.assertIs(FirewallFactory.get_connector_class('test'), TestFirewall)
+    
+    def test_unknown_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FirewallFactory.get_connector_class('nonexistent')
+
+
+class TestBackendIsolationTests(SimpleTestCase):
+    """
+    The test backend must not carry deletions from one task to the next
+    """
+    
+    def setUp(self):
+        tasks._CONNECTOR_POOL.clear()
+        self.addCleanup(tasks._CONNECTOR_POOL.clear)
+    
+    def test_documented_example_can_be_repeated(self):
+        for _ in range(2):
+            result = tasks.delete_ip_object('test', 'TestServer', {})
+            self.assertTrue(result['success'], result['message'])
+
+
+class DeleteIPObjectBatchViewTests(SimpleTestCase):
+    """
+    Tests for the batch delete API endpoint
+    """
+    
+    def setUp(self):
+        self.factory = RequestFactory()
+        patcher = mock.patch.object(views.delete_ip_object_batch, 'delay', return_value=mock.Mock(id='task-1'))
+        self.delay = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def post(self, payload, user=None):
+        request = self.factory.post(
+            '/api/firewall/ip-objects/delete-batch/',
+            data=orjson.dumps(payload),
+            content_type='application/json'
+        )
+        request.user = user or mock.Mock(is_authenticated=True)
+        return views.delete_ip_object_batch_view(request)
+    
+    def test_submits_task_with_deduplicated_ids(self):
+        response = self.post({'firewall_type': 'test', 'ip_object_ids': ['TestServer', 'DevNetwork', 'TestServer']})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(orjson.loads(response.content)['task_id'], 'task-1')
+        self.assertEqual(self.delay.call_args.kwargs['ip_object_ids'], ['TestServer', 'DevNetwork'])
+    
+    def test_passes_extra_connection_params_through(self):
+        self.post({
+            'firewall_type': 'fortinet',
+            'ip_object_ids': ['TestServer'],
+            'connection_params': {'host': 'fw1', 'port': '8443', 'api_key': 'secret', 'verify_ssl': True},
+        })
+        
+        self.assertEqual(self.delay.call_args.kwargs['connection_params'], {
+            'host': 'fw1',
+            'port': 8443,
+            'api_key': 'secret',
+            'verify_ssl': True,
+        })
+    
+    def test_rejects_non_object_connection_params(self):
+        response = self.post({'firewall_type': 'test', 'ip_object_ids': ['TestServer'], 'connection_params': ['fw1']})
+        
+        self.assertEqual(response.status_code, 400)
+        self.delay.assert_not_called()
+    
+    def test_rejects_non_string_ids(self):
+        for ip_object_ids in (['TestServer', 42], [['TestServer']], ['TestServer\nDevNetwork']):
+            response = self.post({'firewall_type': 'test', 'ip_object_ids': ip_object_ids})
+            
+            self.assertEqual(response.status_code, 400)
+        self.delay.assert_not_called()
+    
+    def test_rejects_empty_id_list(self):
+        response = self.post({'firewall_type': 'test', 'ip_object_ids': []})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ip_object_ids', orjson.loads(response.content)['error'])
+    
+    def test_rejects_missing_required_connection_fields(self):
+        response = self.post({'firewall_type': 'checkpoint', 'ip_object_ids': ['TestServer']})
+        
+        self.assertEqual(response.status_code, 400)
+        self.delay.assert_not_called()
+    
+    def test_requires_authentication(self):
+        response = self.post({'firewall_type': 'test', 'ip_object_ids': ['TestServer']}, user=AnonymousUser())
+        
+        self.assertEqual(response.status_code, 401)
+    
+    def test_rejects_get(self):
+        request = self.factory.get('/api/firewall/ip-objects/delete-batch/')
+        request.user = mock.Mock(is_authenticated=True)
+        
+        self.assertEqual(views.delete_ip_object_batch_view(request).status_code, 405)
+
+
+class IPRangeIndexTests(SimpleTestCase):
+    """
+    Tests for parse_ip_value and the IP containment index
+    """
+    
+    def test_parse_ip_value(self):
+        self.assertEqual([str(n) for n in parse_ip_value('10.0.0.1')], ['10.0.0.1/32'])
+        self.assertEqual([str(n) for n in parse_ip_value('10.0.0.5/24')], ['10.0.0.0/24'])
+        self.assertEqual(
+            [str(n) for n in parse_ip_value('10.0.0.1 - 10.0.0.6')],
+            ['10.0.0.1/32', '10.0.0.2/31', '10.0.0.4/31', '10.0.0.6/32']
+        )
+        self.assertEqual(parse_ip_value('not-an-ip'), [])
+    
+    def test_most_specific_match_first(self):
+        wide = IPObject(name='wide', value='10.0.0.0/8', type='network')
+        host = IPObject(name='host', value='10.1.2.3', type='host')
+        mid = IPObject(name='mid', value='10.1.0.0/16', type='network')
+        other = IPObject(name='other', value='192.168.0.0/16', type='network')
+        index = IPRangeIndex().build([wide, host, mid, other])
+        
+        self.assertEqual(index.find_containing('10.1.2.3'), [host, mid, wide])
+        self.assertEqual(index.find_containing('10.2.0.1'), [wide])
+        self.assertEqual(index.find_containing('172.16.0.1'), [])
+    
+    def test_ip_versions_are_kept_apart(self):
+        any_v4 = IPObject(name='any4', value='0.0.0.0/0', type='network')
+        any_v6 = IPObject(name='any6', value='::/0', type='network')
+        doc_v6 = IPObject(name='doc6', value='2001:db8::/32', type='network')
+        index = IPRangeIndex().build([any_v4, any_v6, doc_v6])
+        
+        self.assertEqual(index.find_containing('10.0.0.1'), [any_v4])
+        self.assertEqual(index.find_containing('2001:db8::1'), [doc_v6, any_v6])
+    
+    def test_range_values(self):
+        address_range = IPObject(name='range', value='10.0.0.1-10.0.0.6', type='range')
+        index = IPRangeIndex().build([address_range])
+        
+        self.assertEqual(index.find_containing('10.0.0.1'), [address_range])
+        self.assertEqual(index.find_containing('10.0.0.5'), [address_range])
+        self.assertEqual(index.find_containing('10.0.0.0'), [])
+        self.assertEqual(index.find_containing('10.0.0.7'), [])
+    
+    def test_unparseable_values_are_skipped(self):
+        bad = IPObject(name='bad', value='not-an-ip', type='host')
+        good = IPObject(name='good', value='10.0.0.0/8', type='network')
+        index = IPRangeIndex().build([bad, good])
+        
+        self.assertEqual(index.find_containing('10.0.0.1'), [good])
+    
+    def test_invalid_address_raises(self):
+        index = IPRangeIndex().build([IPObject(name='good', value='10.0.0.0/8', type='network')])
+        
+        with self.assertRaises(ValueError):
+            index.find_containing('not-an-ip')
+
+
+class ModelCoercionTests(SimpleTestCase):
+    """
+    Container members given as lists are stored as sets
+    """
+    
+    def test_rule_fields_become_sets(self):
+        rule = Rule(name='r', source=['a', 'b', 'a'], destination=('c',), service=['https'])
+        
+        self.assertEqual(rule.source, {'a', 'b'})
+        self.assertEqual(rule.destination, {'c'})
+        self.assertEqual(rule.service, {'https'})
+    
+    def test_group_members_become_a_set(self):
+        group = Group(name='g', members=['a', 'b', 'a'])
+        
+        self.assertEqual(group.members, {'a', 'b'})
+
+
+class IPObjectNetworksTests(SimpleTestCase):
+    """
+    Parsed networks stay out of the IPObject fields
+    """
+    
+    def test_networks_are_not_a_field(self):
+        ip_object = IPObject(name='Net', value='10.0.0.0/24', type='network')
+        ip_object.networks
+        
+        self.assertEqual([f.name for f in fields(ip_object)], ['name', 'value', 'type', 'uid', 'description', 'tags'])
+        self.assertNotIn('_networks', asdict(ip_object))
+    
+    def test_networks_follow_the_value(self):
+        ip_object = IPObject(name='Net', value='10.0.0.0/24', type='network')
+        
+        self.assertEqual(ip_object.networks, tuple(parse_ip_value('10.0.0.0/24')))
+        self.assertEqual(replace(ip_object, value='10.0.1.1').networks, tuple(parse_ip_value('10.0.1.1')))
+        self.assertEqual(IPObject(name='Bad', value='not-an-ip', type='host').networks, ())
+
+
+SERVER1 = '11111111-1111-1111-1111-000000000001'
+SERVER2 = '11111111-1111-1111-1111-000000000002'
+TEST_SERVER = '11111111-1111-1111-1111-000000000004'
+WEB_SERVERS = '22222222-2222-2222-2222-000000000001'
+ALL_SERVERS = '22222222-2222-2222-2222-000000000002'
+ALLOW_TEST_ACCESS = '33333333-3333-3333-3333-000000000002'
+
+
+class FailingAllServersFirewall(TestFirewall):
+    """
+    Test firewall whose edits to the AllServers group time out
+    """
+    
+    def remove_ip_from_group(self, group_id: str, ip_object_id: str) -> bool:
+        if group_id == ALL_SERVERS:
+            raise TimeoutError("API timeout")
+        return super().remove_ip_from_group(group_id, ip_object_id)
+
+
+class DependencyCleanupTests(SimpleTestCase):
+    """
+    Tests for FirewallConnector's dependency cleanup, run against TestFirewall
+    """
+    
+    def setUp(self):
+        self.firewall = TestFirewall()
+        self.firewall.connect()
+    
+    def test_cache_from_earlier_calls_is_not_trusted(self):
+        # A copy cached before WebServers gained a second member
+        web_servers = self.firewall.mock_groups[WEB_SERVERS]
+        self.firewall._object_cache[('group', WEB_SERVERS)] = replace(web_servers, members=set(web_servers.members))
+        web_servers.members.add(SERVER2)
+        self.firewall._ip_to_groups.setdefault(SERVER2, set()).add(WEB_SERVERS)
+        
+        result = self.firewall.delete_ip_object_with_dependencies(SERVER1)
+        
+        self.assertIn(WEB_SERVERS, result['groups_modified'])
+        self.assertNotIn(WEB_SERVERS, result['groups_deleted'])
+        self.assertIn(WEB_SERVERS, self.firewall.mock_groups)
+    
+    def test_emptied_group_is_deleted_and_others_kept(self):
+        result = self.firewall.delete_ip_object_with_dependencies('Server1')
+        
+        self.assertTrue(result['success'], result['errors'])
+        self.assertTrue(result['ip_object_deleted'])
+        self.assertCountEqual(result['groups_modified'], [WEB_SERVERS, ALL_SERVERS])
+        self.assertEqual(result['groups_deleted'], [WEB_SERVERS])
+        self.assertNotIn(WEB_SERVERS, self.firewall.mock_groups)
+        self.assertNotIn(SERVER1, self.firewall.mock_groups[ALL_SERVERS].members)
+    
+    def test_bulk_delete_shares_index_and_commits_once(self):
+        with mock.patch.object(self.firewall, 'refresh_dependency_index', wraps=self.firewall.refresh_dependency_index) as refresh, \
+                mock.patch.object(self.firewall, 'get_indexed_dependencies', wraps=self.firewall.get_indexed_dependencies) as indexed, \
+                mock.patch.object(self.firewall, 'commit_changes', wraps=self.firewall.commit_changes) as commit:
+            result = self.firewall.delete_ip_objects_bulk(['TestServer', 'Server2'])
+        
+        self.assertTrue(result['success'], result['errors'])
+        refresh.assert_called_once_with()
+        self.assertEqual(indexed.call_args_list, [mock.call(TEST_SERVER), mock.call(SERVER2)])
+        commit.assert_called_once_with()
+        # The rule still has a source, so emptying its destination keeps it
+        self.assertEqual(result['results']['TestServer']['rules_modified'], [ALLOW_TEST_ACCESS])
+        self.assertEqual(result['results']['TestServer']['rules_deleted'], [])
+        self.assertEqual(self.firewall.mock_rules[ALLOW_TEST_ACCESS].destination, set())
+        self.assertEqual(self.firewall.mock_groups[ALL_SERVERS].members, {SERVER1, WEB_SERVERS})
+        # The index built for the batch must not outlive it
+        self.assertIsNone(self.firewall._dep_index)
+    
+    def test_bulk_delete_without_auto_commit(self):
+        with mock.patch.object(self.firewall, 'commit_changes') as commit:
+            result = self.firewall.delete_ip_objects_bulk(['TestServer', 'Server2'], auto_commit=False)
+        
+        self.assertTrue(result['success'], result['errors'])
+        commit.assert_not_called()
+    
+    def test_failed_group_edit_only_fails_that_group(self):
+        firewall = FailingAllServersFirewall()
+        firewall.connect()
+        
+        result = firewall.delete_ip_objects_bulk(['Server1', 'Server2'])
+        
+        self.assertFalse(result['success'])
+        server1 = result['results']['Server1']
+        self.assertEqual(server1['groups_modified'], [WEB_SERVERS])
+        self.assertEqual(server1['groups_deleted'], [WEB_SERVERS])
+        self.assertTrue(server1['errors'])
+        self.assertTrue(all(ALL_SERVERS in error for error in server1['errors'] if 'group' in error))
+        self.assertFalse(any(WEB_SERVERS in error for error in result['errors']))
+        self.assertNotIn(WEB_SERVERS, firewall.mock_groups)
+        self.assertIsNone(firewall._dep_index)
\ No newline at end of file
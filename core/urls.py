@@ -11,5 +11,6 @@ urlpatterns = [
     
     # API routes
     path('api/firewall/ip-objects/delete/', views.delete_ip_object_view, name='delete_ip_object'),
+    path('api/firewall/ip-objects/delete-batch/', views.delete_ip_object_batch_view, name='delete_ip_object_batch'),
     path('api/tasks/<str:task_id>/', views.task_status_view, name='task_status'),
 ]
\ No newline at end of file
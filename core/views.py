@@ -1,20 +1,76 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse, Http404
-from django.views.decorators.csrf import csrf_exempt
+from django.http import HttpResponse, HttpResponseNotAllowed, JsonResponse, Http404
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
 from django.urls import reverse
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserCreationForm
-import json
+from django.core.cache import cache
 import logging
+import orjson
+from functools import wraps
+from celery import states
 from celery.result import AsyncResult
-from .tasks import delete_ip_object
-from .forms import DeleteIPObjectForm, UserLoginForm, UserRegistrationForm
+from .tasks import delete_ip_object, delete_ip_object_batch
+from .forms import DeleteIPObjectBatchForm, DeleteIPObjectForm, UserLoginForm, UserRegistrationForm
 
 logger = logging.getLogger(__name__)
 
+def api_post_login_required(view_func):
+    """
+    Restrict an API view to POST requests from authenticated users
+    
+    One wrapper instead of stacking require_http_methods and login_required.
+    Unauthenticated requests get a JSON 401 rather than a login redirect.
+    CSRF is not exempted; CsrfViewMiddleware validates the token before the
+    view runs, so clients send the csrftoken cookie value in X-CSRFToken.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+        if not request.user.is_authenticated:
+            return JsonResponse({'error': 'Authentication required'}, status=401)
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+# Seconds to cache the snapshot of a finished task; finished tasks never change
+TASK_SNAPSHOT_CACHE_TTL = 60
+
+def _task_snapshot(task_id):
+    """
+    Get the status and outcome of a task with one result backend lookup
+    
+    Reading the state once also caches the result on the AsyncResult, so the
+    outcome costs no further round-trips. Snapshots of finished tasks are
+    kept in the Django cache so polling clients do not hit the backend again.
+    """
+    cache_key = f'task_snapshot:{task_id}'
+    snapshot = cache.get(cache_key)
+    if snapshot is not None:
+        return snapshot
+    
+    task_result = AsyncResult(task_id)
+    status = task_result.state
+    ready = status in states.READY_STATES
+    snapshot = {
+        'task_id': task_id,
+        'status': status,
+        'ready': ready,
+        'successful': status == states.SUCCESS if ready else None,
+    }
+    
+    # Add result info if the task has completed
+    if ready:
+        if snapshot['successful']:
+            snapshot['result'] = task_result.result
+        else:
+            snapshot['error'] = str(task_result.result)
+        cache.set(cache_key, snapshot, TASK_SNAPSHOT_CACHE_TTL)
+    
+    return snapshot
+
 # Authentication views
 def login_view(request):
     """
@@ -108,29 +164,13 @@ def task_status_view_ui(request, task_id):
     """
     View for displaying the status of a task
     """
-    task_result = AsyncResult(task_id)
-    
     # Prepare task data for template
-    task_data = {
-        'task_id': task_id,
-        'status': task_result.status,
-        'ready': task_result.ready(),
-        'successful': task_result.successful() if task_result.ready() else None,
-    }
-    
-    # Add result info if the task has completed
-    if task_result.ready():
-        if task_result.successful():
-            task_data['result'] = task_result.get()
-        else:
-            task_data['error'] = str(task_result.result)
+    task_data = _task_snapshot(task_id)
     
     # Render the template with task data
     return render(request, 'core/task_status.html', {'task': task_data})
 
-@csrf_exempt
-@require_http_methods(["POST"])
-@login_required
+@api_post_login_required
 def delete_ip_object_view(request):
     """
     API endpoint to delete an IP object from a firewall
@@ -145,7 +185,7 @@ def delete_ip_object_view(request):
     """
     try:
         # Parse the request body as JSON
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         
         # Extract required parameters
         firewall_type = data.get('firewall_type')
@@ -174,10 +214,75 @@ def delete_ip_object_view(request):
             'message': f'Delete task for IP object {ip_object_id} submitted successfully'
         })
         
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON payload'}, status=400)
     except Exception as e:
-        logger.exception(f"Error processing delete request: {str(e)}")
+        logger.exception("Error processing delete request: %s", e)
+        return JsonResponse({'error': str(e)}, status=500)
+
+@api_post_login_required
+def delete_ip_object_batch_view(request):
+    """
+    API endpoint to delete several IP objects from a firewall in one task
+    
+    Expects JSON payload with:
+    - firewall_type: Type of firewall ('checkpoint', 'fortinet', 'test')
+    - ip_object_ids: List of IDs, or newline-separated string of IDs, to delete
+    - connection_params: Connection parameters for the firewall
+    - auto_commit: (Optional) Whether to commit changes once at the end (default: True)
+    
+    Returns JSON response with task_id for tracking
+    """
+    try:
+        # Parse the request body as JSON
+        data = orjson.loads(request.body)
+        if not isinstance(data, dict):
+            return JsonResponse({'error': 'Invalid JSON payload'}, status=400)
+        
+        connection_params = data.get('connection_params') or {}
+        if not isinstance(connection_params, dict):
+            return JsonResponse({'error': 'connection_params must be an object'}, status=400)
+        
+        ip_object_ids = data.get('ip_object_ids') or ''
+        if isinstance(ip_object_ids, list):
+            # Joined for the form's newline-separated field, so each item
+            # must be a single ID
+            if not all(isinstance(ip_object_id, str) and '\n' not in ip_object_id for ip_object_id in ip_object_ids):
+                return JsonResponse({'error': 'ip_object_ids must be a list of strings'}, status=400)
+            ip_object_ids = '\n'.join(ip_object_ids)
+        
+        # Validate through the batch form so the web and API rules match
+        form = DeleteIPObjectBatchForm({
+            **connection_params,
+            'firewall_type': data.get('firewall_type'),
+            'ip_object_ids': ip_object_ids,
+            'auto_commit': data.get('auto_commit', True),
+        })
+        if not form.is_valid():
+            return JsonResponse({'error': form.errors.get_json_data()}, status=400)
+        
+        # Submit the batch delete task asynchronously. Keys the form does not
+        # know (api_key, verify_ssl, timeout, ...) are passed through as the
+        # single-delete endpoint does; validated values take precedence.
+        ip_object_ids = form.cleaned_data['ip_object_ids']
+        task = delete_ip_object_batch.delay(
+            firewall_type=form.cleaned_data['firewall_type'],
+            ip_object_ids=ip_object_ids,
+            connection_params={**connection_params, **form.get_connection_params()},
+            auto_commit=form.cleaned_data['auto_commit']
+        )
+        
+        # Return the task ID for tracking
+        return JsonResponse({
+            'status': 'task_submitted',
+            'task_id': task.id,
+            'message': f'Delete task for {len(ip_object_ids)} IP objects submitted successfully'
+        })
+        
+    except orjson.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON payload'}, status=400)
+    except Exception as e:
+        logger.exception("Error processing batch delete request: %s", e)
         return JsonResponse({'error': str(e)}, status=500)
 
 @require_http_methods(["GET"])
@@ -192,20 +297,17 @@ def task_status_view(request, task_id):
     Returns:
         JSON response with task status
     """
-    from celery.result import AsyncResult
-    
-    task_result = AsyncResult(task_id)
+    snapshot = _task_snapshot(task_id)
     
     result = {
         'task_id': task_id,
-        'status': task_result.status,
+        'status': snapshot['status'],
     }
     
     # Add result info if the task has completed
-    if task_result.ready():
-        if task_result.successful():
-            result['result'] = task_result.get()
-        else:
-            result['error'] = str(task_result.result)
+    for key in ('result', 'error'):
+        if key in snapshot:
+            result[key] = snapshot[key]
     
-    return JsonResponse(result)
\ No newline at end of file
+    # Results can carry the full deletion details; orjson encodes them faster
+    return HttpResponse(orjson.dumps(result), content_type='application/json')
\ No newline at end of file
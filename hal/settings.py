@@ -129,4 +129,7 @@ LOGOUT_REDIRECT_URL = 'login'
 
 # Session settings
 SESSION_COOKIE_AGE = 86400  # 1 day in seconds
-SESSION_SAVE_EVERY_REQUEST = True
\ No newline at end of file
+SESSION_SAVE_EVERY_REQUEST = True
+
+# Firewall settings
+TEST_FIREWALL_SIMULATE_LATENCY = int(os.environ.get('TEST_FIREWALL_SIMULATE_LATENCY', 0))  # Add API delays to the test backend
\ No newline at end of file